@@ -18,15 +18,25 @@ def _rows_to_dicts(cur: sqlite3.Cursor) -> List[Dict[str, Any]]:
     return [dict(zip(cols, row)) for row in cur.fetchall()]
 
 
-def get_ro_conn() -> sqlite3.Connection:
+def get_ro_uri(shared_cache: bool = True) -> str:
+    """SQLite URI for a read-only connection to the app's database."""
     db_path = Path(current_app.config.get("DB_PATH", "./data/dlns.sqlite3")).resolve()
-    uri = f"file:{db_path.as_posix()}?mode=ro&cache=shared"
-    conn = sqlite3.connect(uri, uri=True, timeout=15)
+    uri = f"file:{db_path.as_posix()}?mode=ro"
+    return uri + "&cache=shared" if shared_cache else uri
+
+
+def connect_ro(uri: str, **kwargs: Any) -> sqlite3.Connection:
+    """Open a read-only connection from a `get_ro_uri()` URI (usable outside app context)."""
+    conn = sqlite3.connect(uri, uri=True, timeout=15, **kwargs)
     conn.execute("PRAGMA foreign_keys=ON;")
     conn.execute("PRAGMA busy_timeout=5000;")
     return conn
 
 
+def get_ro_conn() -> sqlite3.Connection:
+    return connect_ro(get_ro_uri())
+
+
 def format_player_data(player_row):
     """Convert player row to dict with hero name included."""
     player = dict(player_row)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import uuid
+import hashlib
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -259,6 +260,13 @@ def handle_upload():
 
         f.save(dest)
 
+        # Published with the mod so the installer can verify its download
+        digest = hashlib.sha256()
+        with open(dest, "rb") as fh:
+            for chunk in iter(lambda: fh.read(1024 * 1024), b""):
+                digest.update(chunk)
+        sha256 = digest.hexdigest()
+
         user_id_str, username = _get_user_id_and_name()
 
         mod = {
@@ -270,6 +278,7 @@ def handle_upload():
             "uploaded_by_id": user_id_str,
             "uploaded_by_name": username,
             "size": dest.stat().st_size,
+            "sha256": sha256,
         }
 
         mods = load_mods()
@@ -407,6 +416,13 @@ def view_source():
 # ---------------------------------------------------------------------------
 
 
+def _conditional_json(payload: Dict[str, Any]):
+    """JSON response with an ETag; answers If-None-Match with 304 Not Modified."""
+    resp = jsonify(payload)
+    resp.add_etag()
+    return resp.make_conditional(request)
+
+
 @gluten_bp.route("/api/mods")
 def api_mods():
     mods = sorted(
@@ -420,7 +436,7 @@ def api_mods():
             _external=True,
         )
 
-    return jsonify({"mods": mods})
+    return _conditional_json({"mods": mods})
 
 
 @gluten_bp.route("/api/check")
@@ -455,4 +471,4 @@ def api_check():
 
 @gluten_bp.route("/api/version")
 def version_api():
-    return jsonify({"version": VERSION})
+    return _conditional_json({"version": VERSION})
@@ -1,6 +1,14 @@
 from flask import Blueprint, render_template
-from blueprints.db_api import get_ro_conn
+from blueprints.db_api import get_ro_uri, connect_ro
 from heroes import get_hero_name
+from cache import cache
+from utils.auth import is_logged_in
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import json
+import os
+import queue
+import sqlite3
 import threading
 import time
 import logging
@@ -9,466 +17,498 @@ from flask import current_app  # added
 stats_bp = Blueprint('stats', __name__, url_prefix='/stats')
 
 # Global cache for statistics data
-_stats_cache = None
-_cache_lock = threading.RLock()
-_last_update = 0
+# (stats, last_update) published as one tuple: readers take a single atomic
+# snapshot without locking
+_cache_state = (None, 0)
+# Single flight: whoever holds this is recomputing; everyone else serves the
+# previous snapshot instead of starting a duplicate computation
+_refresh_inflight = threading.Lock()
+# Wakes the background refresher early (e.g. after a manual refresh)
+_refresh_wakeup = threading.Event()
 CACHE_DURATION = 300  # 5 minutes in seconds
+# Bump whenever the shape of the statistics dict changes so cache files
+# written by an older deploy are ignored instead of breaking the template
+STATS_CACHE_VERSION = 1
+# A compute lock older than this is assumed abandoned (worker killed mid-compute)
+STATS_LOCK_TIMEOUT = 120
 
-@stats_bp.context_processor
-def inject_helpers():
-    return dict(get_hero_name=get_hero_name)
+# (top_performers key, players column) for the plain top-5 leaderboards
+TOP_PERFORMER_METRICS = (
+    ('killers', 'kills'),
+    ('damage_dealers', 'player_damage'),
+    ('healers', 'player_healing'),
+    ('souls', 'net_worth'),
+    ('last_hits', 'last_hits'),
+    ('obj_damage', 'obj_damage'),
+    ('assists', 'assists'),
+)
 
-def _compute_statistics():
-    """Compute all statistics from database."""
-    with get_ro_conn() as conn:
-        # Basic counts
-        match_count = conn.execute("SELECT COUNT(*) FROM matches").fetchone()[0]
-        user_count = conn.execute("SELECT COUNT(*) FROM users").fetchone()[0]
-        
-        # Win/Loss totals
-        wins = conn.execute("SELECT COUNT(*) FROM players WHERE result = 'Win'").fetchone()[0]
-        losses = conn.execute("SELECT COUNT(*) FROM players WHERE result = 'Loss'").fetchone()[0]
-        
-        # Aggregate statistics from players table
-        stats_query = """
-        SELECT 
-            COALESCE(SUM(shots_hit), 0) as total_shots_hit,
-            COALESCE(SUM(shots_missed), 0) as total_shots_missed,
-            COALESCE(SUM(player_damage), 0) as total_player_damage,
-            COALESCE(SUM(player_healing), 0) as total_player_healing,
-            COALESCE(SUM(kills), 0) as total_kills,
-            COALESCE(SUM(deaths), 0) as total_deaths,
-            COALESCE(SUM(assists), 0) as total_assists,
-            COALESCE(SUM(creep_kills), 0) as total_creep_kills,
-            COALESCE(SUM(last_hits), 0) as total_last_hits,
-            COALESCE(SUM(denies), 0) as total_denies,
-            COALESCE(SUM(obj_damage), 0) as total_obj_damage,
-            COALESCE(SUM(pings_count), 0) as total_pings,
-            COALESCE(SUM(net_worth), 0) as total_net_worth,
-            COALESCE(AVG(kills), 0) as avg_kills,
-            COALESCE(AVG(deaths), 0) as avg_deaths,
-            COALESCE(AVG(assists), 0) as avg_assists,
-            COALESCE(AVG(net_worth), 0) as avg_net_worth
-        FROM players
-        """
-        
-        stats_row = conn.execute(stats_query).fetchone()
-        
-        # Calculate additional stats
-        total_shots_fired = stats_row[0] + stats_row[1]  # shots_hit + shots_missed
-        shot_accuracy = (stats_row[0] / total_shots_fired * 100) if total_shots_fired > 0 else 0
-        
-        # Hero selection statistics
-        hero_selection = conn.execute("""
-        SELECT 
-            hero_id,
-            COUNT(*) as pick_count
-        FROM players 
-        WHERE hero_id IS NOT NULL
-        GROUP BY hero_id
-        HAVING pick_count > 0
-        ORDER BY pick_count DESC
-        """).fetchall()
-        
-        most_picked_hero = hero_selection[0] if hero_selection else None
-        least_picked_hero = hero_selection[-1] if hero_selection else None
-        
-        # Match duration statistics with match IDs
-        duration_stats = conn.execute("""
-        SELECT 
-            COALESCE(AVG(duration_s), 0) as avg_duration,
-            COALESCE(MIN(duration_s), 0) as min_duration,
-            COALESCE(MAX(duration_s), 0) as max_duration,
-            COALESCE(SUM(duration_s), 0) as total_duration
-        FROM matches 
-        WHERE duration_s IS NOT NULL AND duration_s > 0
-        """).fetchone()
-        
-        # Get match IDs for shortest and longest matches
-        min_match = conn.execute("""
-        SELECT match_id FROM matches 
-        WHERE duration_s IS NOT NULL AND duration_s > 0
-        ORDER BY duration_s ASC LIMIT 1
-        """).fetchone()
-        
-        max_match = conn.execute("""
-        SELECT match_id FROM matches 
-        WHERE duration_s IS NOT NULL AND duration_s > 0
-        ORDER BY duration_s DESC LIMIT 1
-        """).fetchone()
-        
-        # Team statistics
-        team_stats = conn.execute("""
-        SELECT 
-            winning_team,
-            COUNT(*) as wins
-        FROM matches 
-        WHERE winning_team IS NOT NULL
-        GROUP BY winning_team
-        ORDER BY winning_team
-        """).fetchall()
-        
-        # Top performers (expanded)
-        top_killers = conn.execute("""
-        SELECT 
-            u.persona_name,
-            p.kills,
-            p.match_id
-        FROM players p
-        LEFT JOIN users u ON u.account_id = p.account_id
-        ORDER BY p.kills DESC
-        LIMIT 5
-        """).fetchall()
-        
-        top_damage_dealers = conn.execute("""
-        SELECT 
-            u.persona_name,
-            p.player_damage,
-            p.match_id
-        FROM players p
-        LEFT JOIN users u ON u.account_id = p.account_id
-        ORDER BY p.player_damage DESC
-        LIMIT 5
-        """).fetchall()
-        
-        top_healers = conn.execute("""
-        SELECT 
-            u.persona_name,
-            p.player_healing,
-            p.match_id
-        FROM players p
-        LEFT JOIN users u ON u.account_id = p.account_id
-        ORDER BY p.player_healing DESC
-        LIMIT 5
-        """).fetchall()
-        
-        # Top souls (net_worth)
-        top_souls = conn.execute("""
-        SELECT 
-            u.persona_name,
-            p.net_worth,
-            p.match_id
-        FROM players p
-        LEFT JOIN users u ON u.account_id = p.account_id
-        ORDER BY p.net_worth DESC
-        LIMIT 5
-        """).fetchall()
-        
-        # Top last hits
-        top_last_hits = conn.execute("""
-        SELECT 
-            u.persona_name,
-            p.last_hits,
-            p.match_id
-        FROM players p
-        LEFT JOIN users u ON u.account_id = p.account_id
-        ORDER BY p.last_hits DESC
-        LIMIT 5
-        """).fetchall()
-        
-        # Top objective damage
-        top_obj_damage = conn.execute("""
-        SELECT 
-            u.persona_name,
-            p.obj_damage,
-            p.match_id
-        FROM players p
-        LEFT JOIN users u ON u.account_id = p.account_id
-        ORDER BY p.obj_damage DESC
-        LIMIT 5
-        """).fetchall()
-        
-        # Best KDA performers (kills + assists / deaths, minimum 5 deaths to avoid division issues)
-        top_kda = conn.execute("""
-        SELECT 
-            u.persona_name,
-            ROUND((CAST(p.kills + p.assists AS FLOAT) / NULLIF(p.deaths, 0)), 2) as kda,
-            p.kills,
-            p.deaths,
-            p.assists,
-            p.match_id
-        FROM players p
-        LEFT JOIN users u ON u.account_id = p.account_id
-        WHERE p.deaths > 0
-        ORDER BY kda DESC
-        LIMIT 5
-        """).fetchall()
-        
-        # Most assists
-        top_assists = conn.execute("""
-        SELECT 
-            u.persona_name,
-            p.assists,
-            p.match_id
-        FROM players p
-        LEFT JOIN users u ON u.account_id = p.account_id
-        ORDER BY p.assists DESC
-        LIMIT 5
-        """).fetchall()
-        
-        # Best kills by hero
-        hero_kills = conn.execute("""
-        SELECT 
-            p.hero_id,
-            MAX(p.kills) as max_kills
-        FROM players p
-        WHERE p.hero_id IS NOT NULL AND p.kills IS NOT NULL
-        GROUP BY p.hero_id
-        ORDER BY max_kills DESC
-        LIMIT 1
-        """).fetchone()
-        
-        # Get player info for best kills hero record
-        hero_kills_detail = None
-        if hero_kills:
-            hero_kills_detail = conn.execute("""
-            SELECT p.match_id, u.persona_name
-            FROM players p
-            LEFT JOIN users u ON u.account_id = p.account_id
-            WHERE p.hero_id = ? AND p.kills = ?
-            LIMIT 1
-            """, (hero_kills[0], hero_kills[1])).fetchone()
-        
-        # Best damage by hero
-        hero_damage = conn.execute("""
-        SELECT 
-            p.hero_id,
-            MAX(p.player_damage) as max_damage
-        FROM players p
-        WHERE p.hero_id IS NOT NULL AND p.player_damage IS NOT NULL
-        GROUP BY p.hero_id
-        ORDER BY max_damage DESC
-        LIMIT 1
-        """).fetchone()
-        
-        # Get player info for best damage hero record
-        hero_damage_detail = None
-        if hero_damage:
-            hero_damage_detail = conn.execute("""
-            SELECT p.match_id, u.persona_name
-            FROM players p
-            LEFT JOIN users u ON u.account_id = p.account_id
-            WHERE p.hero_id = ? AND p.player_damage = ?
-            LIMIT 1
-            """, (hero_damage[0], hero_damage[1])).fetchone()
-        
-        # Best healing by hero
-        hero_healing = conn.execute("""
-        SELECT 
-            p.hero_id,
-            MAX(p.player_healing) as max_healing
-        FROM players p
-        WHERE p.hero_id IS NOT NULL AND p.player_healing IS NOT NULL
-        GROUP BY p.hero_id
-        ORDER BY max_healing DESC
-        LIMIT 1
-        """).fetchone()
-        
-        # Get player info for best healing hero record
-        hero_healing_detail = None
-        if hero_healing:
-            hero_healing_detail = conn.execute("""
-            SELECT p.match_id, u.persona_name
+# All top-5 leaderboards in one statement. Each UNION ALL branch keeps its own
+# ORDER BY ... LIMIT so SQLite still runs a cheap top-N sort per metric.
+_TOP_PERFORMERS_SQL = " UNION ALL ".join(
+    [
+        f"""
+        SELECT * FROM (
+            SELECT {i} AS grp, u.persona_name, p.{col} AS val,
+                   NULL AS kills, NULL AS deaths, NULL AS assists, p.match_id
             FROM players p
             LEFT JOIN users u ON u.account_id = p.account_id
-            WHERE p.hero_id = ? AND p.player_healing = ?
-            LIMIT 1
-            """, (hero_healing[0], hero_healing[1])).fetchone()
-        
-        # Best souls by hero
-        hero_souls = conn.execute("""
-        SELECT 
-            p.hero_id,
-            MAX(p.net_worth) as max_souls
-        FROM players p
-        WHERE p.hero_id IS NOT NULL AND p.net_worth IS NOT NULL
-        GROUP BY p.hero_id
-        ORDER BY max_souls DESC
-        LIMIT 1
-        """).fetchone()
-        
-        # Get player info for best souls hero record
-        hero_souls_detail = None
-        if hero_souls:
-            hero_souls_detail = conn.execute("""
-            SELECT p.match_id, u.persona_name
+            ORDER BY p.{col} DESC
+            LIMIT 5
+        )"""
+        for i, (_, col) in enumerate(TOP_PERFORMER_METRICS)
+    ]
+    + [
+        # Best KDA performers (kills + assists / deaths, deaths > 0 to avoid division issues)
+        f"""
+        SELECT * FROM (
+            SELECT {len(TOP_PERFORMER_METRICS)} AS grp, u.persona_name,
+                   ROUND((CAST(p.kills + p.assists AS FLOAT) / NULLIF(p.deaths, 0)), 2) AS val,
+                   p.kills, p.deaths, p.assists, p.match_id
             FROM players p
             LEFT JOIN users u ON u.account_id = p.account_id
-            WHERE p.hero_id = ? AND p.net_worth = ?
-            LIMIT 1
-            """, (hero_souls[0], hero_souls[1])).fetchone()
-        
-        # Best last hits by hero
-        hero_last_hits = conn.execute("""
-        SELECT 
-            p.hero_id,
-            MAX(p.last_hits) as max_last_hits
+            WHERE p.deaths > 0
+            ORDER BY val DESC
+            LIMIT 5
+        )"""
+    ]
+) + " ORDER BY grp, val DESC"
+
+# (hero_records key, players column) for the best-single-game-by-hero records
+HERO_RECORD_METRICS = (
+    ('kills', 'kills'),
+    ('damage', 'player_damage'),
+    ('healing', 'player_healing'),
+    ('souls', 'net_worth'),
+    ('last_hits', 'last_hits'),
+)
+
+# The best per-hero max is simply the best row overall, so each record is one
+# ORDER BY ... LIMIT 1 that already carries the match and player - no second
+# lookup by (hero_id, value) needed.
+_HERO_RECORDS_SQL = " UNION ALL ".join(
+    f"""
+    SELECT * FROM (
+        SELECT {i} AS grp, p.hero_id, p.{col} AS val, p.match_id, u.persona_name
         FROM players p
-        WHERE p.hero_id IS NOT NULL AND p.last_hits IS NOT NULL
-        GROUP BY p.hero_id
-        ORDER BY max_last_hits DESC
+        LEFT JOIN users u ON u.account_id = p.account_id
+        WHERE p.hero_id IS NOT NULL AND p.{col} IS NOT NULL
+        ORDER BY p.{col} DESC
         LIMIT 1
-        """).fetchone()
-        
-        # Get player info for best last hits hero record
-        hero_last_hits_detail = None
-        if hero_last_hits:
-            hero_last_hits_detail = conn.execute("""
-            SELECT p.match_id, u.persona_name
-            FROM players p
-            LEFT JOIN users u ON u.account_id = p.account_id
-            WHERE p.hero_id = ? AND p.last_hits = ?
-            LIMIT 1
-            """, (hero_last_hits[0], hero_last_hits[1])).fetchone()
-        
-        return {
-            'basic': {
-                'match_count': match_count,
-                'user_count': user_count,
-                'total_wins': wins,
-                'total_losses': losses
-            },
-            'combat': {
-                'total_kills': int(stats_row[4]),
-                'total_deaths': int(stats_row[5]),
-                'total_assists': int(stats_row[6]),
-                'total_player_damage': int(stats_row[2]),
-                'total_obj_damage': int(stats_row[10]),
-                'total_player_healing': int(stats_row[3]),
-                'total_net_worth': int(stats_row[12]),
-                'avg_kills': round(stats_row[13], 2),
-                'avg_deaths': round(stats_row[14], 2),
-                'avg_assists': round(stats_row[15], 2),
-                'avg_net_worth': round(stats_row[16], 2)
-            },
-            'shooting': {
-                'total_shots_hit': int(stats_row[0]),
-                'total_shots_missed': int(stats_row[1]),
-                'total_shots_fired': int(total_shots_fired),
-                'shot_accuracy': round(shot_accuracy, 2)
-            },
-            'farming': {
-                'total_creep_kills': int(stats_row[7]),
-                'total_last_hits': int(stats_row[8]),
-                'total_denies': int(stats_row[9])
-            },
-            'communication': {
-                'total_pings': int(stats_row[11])
-            },
-            'heroes': {
-                'most_picked': {
-                    'hero_id': most_picked_hero[0] if most_picked_hero else None,
-                    'hero_name': get_hero_name(most_picked_hero[0]) if most_picked_hero else 'None',
-                    'pick_count': most_picked_hero[1] if most_picked_hero else 0
-                },
-                'least_picked': {
-                    'hero_id': least_picked_hero[0] if least_picked_hero else None,
-                    'hero_name': get_hero_name(least_picked_hero[0]) if least_picked_hero else 'None',
-                    'pick_count': least_picked_hero[1] if least_picked_hero else 0
-                }
-            },
-            'duration': {
-                'avg_duration': int(duration_stats[0]),
-                'min_duration': int(duration_stats[1]),
-                'max_duration': int(duration_stats[2]),
-                'total_duration': int(duration_stats[3]),
-                'min_match_id': min_match[0] if min_match else 0,
-                'max_match_id': max_match[0] if max_match else 0
-            },
-            'teams': {
-                'amber_wins': next((t[1] for t in team_stats if t[0] == 0), 0),
-                'sapphire_wins': next((t[1] for t in team_stats if t[0] == 1), 0)
-            },
-            'top_performers': {
-                'killers': top_killers,
-                'damage_dealers': top_damage_dealers,
-                'healers': top_healers,
-                'souls': top_souls,
-                'last_hits': top_last_hits,
-                'obj_damage': top_obj_damage,
-                'kda': top_kda,
-                'assists': top_assists
+    )"""
+    for i, (_, col) in enumerate(HERO_RECORD_METRICS)
+)
+
+# Pick count per hero, served by idx_players_hero
+_HERO_SELECTION_SQL = """
+    SELECT 
+        hero_id,
+        COUNT(*) as pick_count
+    FROM players 
+    WHERE hero_id IS NOT NULL
+    GROUP BY hero_id
+    HAVING pick_count > 0
+    ORDER BY pick_count DESC
+    """
+
+# Duration aggregates plus shortest/longest match, all served by idx_matches_duration
+_DURATION_SQL = """
+    SELECT 
+        COALESCE(AVG(duration_s), 0) as avg_duration,
+        COALESCE(MIN(duration_s), 0) as min_duration,
+        COALESCE(MAX(duration_s), 0) as max_duration,
+        COALESCE(SUM(duration_s), 0) as total_duration,
+        (SELECT match_id FROM matches
+         WHERE duration_s IS NOT NULL AND duration_s > 0
+         ORDER BY duration_s ASC LIMIT 1) as min_match_id,
+        (SELECT match_id FROM matches
+         WHERE duration_s IS NOT NULL AND duration_s > 0
+         ORDER BY duration_s DESC LIMIT 1) as max_match_id
+    FROM matches 
+    WHERE duration_s IS NOT NULL AND duration_s > 0
+    """
+
+# Read-only connections kept across refreshes so the independent statistics
+# queries can run side by side (WAL allows concurrent readers). Private cache:
+# shared-cache connections would serialise on one cache mutex.
+_ro_pool: "queue.SimpleQueue" = queue.SimpleQueue()
+_query_executor = ThreadPoolExecutor(
+    max_workers=min(8, os.cpu_count() or 1),
+    thread_name_prefix="stats-query",
+)
+
+def _pooled_fetchall(uri, sql):
+    """Run one query on a pooled read-only connection (worker thread)."""
+    try:
+        conn = _ro_pool.get_nowait()
+    except queue.Empty:
+        conn = connect_ro(uri, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        # Read-side tuning, worth it because pooled connections are reused.
+        # journal_mode/synchronous are the writer's business (main.py sets
+        # WAL) and can't be changed from a mode=ro connection.
+        conn.execute("PRAGMA query_only=ON;")
+        conn.execute("PRAGMA temp_store=MEMORY;")
+        conn.execute("PRAGMA cache_size=-65536;")  # 64 MiB page cache
+        conn.execute("PRAGMA mmap_size=268435456;")  # 256 MiB memory-mapped reads
+    try:
+        return conn.execute(sql).fetchall()
+    finally:
+        _ro_pool.put(conn)
+
+# Index (from main.py's schema) each leaderboard column is expected to be served by
+_METRIC_INDEXES = {
+    'kills': 'idx_players_kills',
+    'assists': 'idx_players_assists',
+    'player_damage': 'idx_players_damage',
+    'player_healing': 'idx_players_healing',
+    'net_worth': 'idx_players_net_worth',
+    'last_hits': 'idx_players_last_hits',
+    'obj_damage': 'idx_players_obj_damage',
+}
+
+def _check_query_plans(uri):
+    """Warn if the planner stopped using the stats indexes (missing index, planner change)."""
+    checks = (
+        ('top performers', _TOP_PERFORMERS_SQL, [_METRIC_INDEXES[col] for _, col in TOP_PERFORMER_METRICS]),
+        ('hero records', _HERO_RECORDS_SQL, [_METRIC_INDEXES[col] for _, col in HERO_RECORD_METRICS]),
+        ('hero selection', _HERO_SELECTION_SQL, ['idx_players_hero']),
+        ('duration', _DURATION_SQL, ['idx_matches_duration']),
+    )
+    try:
+        conn = connect_ro(uri)
+        try:
+            for label, sql, indexes in checks:
+                plan = " ".join(row[-1] for row in conn.execute("EXPLAIN QUERY PLAN " + sql))
+                missing = [index for index in indexes if index not in plan]
+                if missing:
+                    logging.warning(f"Statistics {label} query not using indexes: {', '.join(missing)}")
+        finally:
+            conn.close()
+    except Exception as e:
+        logging.warning(f"Could not check statistics query plans: {e}")
+
+@stats_bp.context_processor
+def inject_helpers():
+    return dict(get_hero_name=get_hero_name)
+
+def _compute_statistics():
+    """Compute all statistics from database."""
+    # Resolved here because the query workers run outside the app context
+    uri = get_ro_uri(shared_cache=False)
+    
+    def submit(sql):
+        return _query_executor.submit(_pooled_fetchall, uri, sql)
+    
+    # Aggregate statistics from players table, plus the basic counts
+    # and win/loss totals so they ride along on the same scan
+    stats_future = submit("""
+    SELECT 
+        COALESCE(SUM(shots_hit), 0) as total_shots_hit,
+        COALESCE(SUM(shots_missed), 0) as total_shots_missed,
+        COALESCE(SUM(player_damage), 0) as total_player_damage,
+        COALESCE(SUM(player_healing), 0) as total_player_healing,
+        COALESCE(SUM(kills), 0) as total_kills,
+        COALESCE(SUM(deaths), 0) as total_deaths,
+        COALESCE(SUM(assists), 0) as total_assists,
+        COALESCE(SUM(creep_kills), 0) as total_creep_kills,
+        COALESCE(SUM(last_hits), 0) as total_last_hits,
+        COALESCE(SUM(denies), 0) as total_denies,
+        COALESCE(SUM(obj_damage), 0) as total_obj_damage,
+        COALESCE(SUM(pings_count), 0) as total_pings,
+        COALESCE(SUM(net_worth), 0) as total_net_worth,
+        COUNT(kills) as n_kills,
+        COUNT(deaths) as n_deaths,
+        COUNT(assists) as n_assists,
+        COUNT(net_worth) as n_net_worth,
+        COALESCE(SUM(result = 'Win'), 0) as total_wins,
+        COALESCE(SUM(result = 'Loss'), 0) as total_losses,
+        (SELECT COUNT(*) FROM matches) as match_count,
+        (SELECT COUNT(*) FROM users) as user_count
+    FROM players
+    """)
+    
+    # Hero selection statistics
+    hero_selection_future = submit(_HERO_SELECTION_SQL)
+    
+    # Match duration statistics with match IDs
+    duration_future = submit(_DURATION_SQL)
+    
+    # Team statistics
+    team_future = submit("""
+    SELECT 
+        winning_team,
+        COUNT(*) as wins
+    FROM matches 
+    WHERE winning_team IS NOT NULL
+    GROUP BY winning_team
+    ORDER BY winning_team
+    """)
+    
+    top_future = submit(_TOP_PERFORMERS_SQL)
+    hero_records_future = submit(_HERO_RECORDS_SQL)
+    
+    # All queries are in flight; collect results in order
+    stats_row = stats_future.result()[0]
+    
+    # Calculate additional stats
+    total_shots_fired = stats_row['total_shots_hit'] + stats_row['total_shots_missed']
+    shot_accuracy = (stats_row['total_shots_hit'] / total_shots_fired * 100) if total_shots_fired > 0 else 0
+    
+    def average(column):
+        # AVG() is SUM/COUNT over non-NULL values; both are already in stats_row
+        count = stats_row[f'n_{column}']
+        return stats_row[f'total_{column}'] / count if count else 0
+    
+    hero_selection = hero_selection_future.result()
+    most_picked_hero = hero_selection[0] if hero_selection else None
+    least_picked_hero = hero_selection[-1] if hero_selection else None
+    
+    duration_stats = duration_future.result()[0]
+    team_stats = team_future.result()
+    
+    # Top performers (expanded): all leaderboards in a single round trip
+    top_performers = {key: [] for key, _ in TOP_PERFORMER_METRICS}
+    top_performers['kda'] = []
+    for grp, persona_name, val, kills, deaths, assists, match_id in top_future.result():
+        if grp < len(TOP_PERFORMER_METRICS):
+            top_performers[TOP_PERFORMER_METRICS[grp][0]].append((persona_name, val, match_id))
+        else:
+            top_performers['kda'].append((persona_name, val, kills, deaths, assists, match_id))
+    
+    # Best single game by hero for each metric, in a single round trip
+    hero_records = {key: None for key, _ in HERO_RECORD_METRICS}
+    for grp, hero_id, value, match_id, persona_name in hero_records_future.result():
+        hero_records[HERO_RECORD_METRICS[grp][0]] = {
+            'hero_name': get_hero_name(hero_id),
+            'value': value,
+            'match_id': match_id,
+            'player': persona_name
+        }
+    
+    return {
+        'basic': {
+            'match_count': stats_row['match_count'],
+            'user_count': stats_row['user_count'],
+            'total_wins': stats_row['total_wins'],
+            'total_losses': stats_row['total_losses']
+        },
+        'combat': {
+            'total_kills': int(stats_row['total_kills']),
+            'total_deaths': int(stats_row['total_deaths']),
+            'total_assists': int(stats_row['total_assists']),
+            'total_player_damage': int(stats_row['total_player_damage']),
+            'total_obj_damage': int(stats_row['total_obj_damage']),
+            'total_player_healing': int(stats_row['total_player_healing']),
+            'total_net_worth': int(stats_row['total_net_worth']),
+            'avg_kills': round(average('kills'), 2),
+            'avg_deaths': round(average('deaths'), 2),
+            'avg_assists': round(average('assists'), 2),
+            'avg_net_worth': round(average('net_worth'), 2)
+        },
+        'shooting': {
+            'total_shots_hit': int(stats_row['total_shots_hit']),
+            'total_shots_missed': int(stats_row['total_shots_missed']),
+            'total_shots_fired': int(total_shots_fired),
+            'shot_accuracy': round(shot_accuracy, 2)
+        },
+        'farming': {
+            'total_creep_kills': int(stats_row['total_creep_kills']),
+            'total_last_hits': int(stats_row['total_last_hits']),
+            'total_denies': int(stats_row['total_denies'])
+        },
+        'communication': {
+            'total_pings': int(stats_row['total_pings'])
+        },
+        'heroes': {
+            'most_picked': {
+                'hero_id': most_picked_hero['hero_id'] if most_picked_hero else None,
+                'hero_name': get_hero_name(most_picked_hero['hero_id']) if most_picked_hero else 'None',
+                'pick_count': most_picked_hero['pick_count'] if most_picked_hero else 0
             },
-            'hero_records': {
-                'kills': {
-                    'hero_name': get_hero_name(hero_kills[0]) if hero_kills else 'None',
-                    'value': hero_kills[1] if hero_kills else 0,
-                    'match_id': hero_kills_detail[0] if hero_kills_detail else 0,
-                    'player': hero_kills_detail[1] if hero_kills_detail else 'Unknown'
-                } if hero_kills else None,
-                'damage': {
-                    'hero_name': get_hero_name(hero_damage[0]) if hero_damage else 'None',
-                    'value': hero_damage[1] if hero_damage else 0,
-                    'match_id': hero_damage_detail[0] if hero_damage_detail else 0,
-                    'player': hero_damage_detail[1] if hero_damage_detail else 'Unknown'
-                } if hero_damage else None,
-                'healing': {
-                    'hero_name': get_hero_name(hero_healing[0]) if hero_healing else 'None',
-                    'value': hero_healing[1] if hero_healing else 0,
-                    'match_id': hero_healing_detail[0] if hero_healing_detail else 0,
-                    'player': hero_healing_detail[1] if hero_healing_detail else 'Unknown'
-                } if hero_healing else None,
-                'souls': {
-                    'hero_name': get_hero_name(hero_souls[0]) if hero_souls else 'None',
-                    'value': hero_souls[1] if hero_souls else 0,
-                    'match_id': hero_souls_detail[0] if hero_souls_detail else 0,
-                    'player': hero_souls_detail[1] if hero_souls_detail else 'Unknown'
-                } if hero_souls else None,
-                'last_hits': {
-                    'hero_name': get_hero_name(hero_last_hits[0]) if hero_last_hits else 'None',
-                    'value': hero_last_hits[1] if hero_last_hits else 0,
-                    'match_id': hero_last_hits_detail[0] if hero_last_hits_detail else 0,
-                    'player': hero_last_hits_detail[1] if hero_last_hits_detail else 'Unknown'
-                } if hero_last_hits else None
+            'least_picked': {
+                'hero_id': least_picked_hero['hero_id'] if least_picked_hero else None,
+                'hero_name': get_hero_name(least_picked_hero['hero_id']) if least_picked_hero else 'None',
+                'pick_count': least_picked_hero['pick_count'] if least_picked_hero else 0
             }
-        }
+        },
+        'duration': {
+            'avg_duration': int(duration_stats['avg_duration']),
+            'min_duration': int(duration_stats['min_duration']),
+            'max_duration': int(duration_stats['max_duration']),
+            'total_duration': int(duration_stats['total_duration']),
+            'min_match_id': duration_stats['min_match_id'] or 0,
+            'max_match_id': duration_stats['max_match_id'] or 0
+        },
+        'teams': {
+            'amber_wins': next((t['wins'] for t in team_stats if t['winning_team'] == 0), 0),
+            'sapphire_wins': next((t['wins'] for t in team_stats if t['winning_team'] == 1), 0)
+        },
+        'top_performers': {
+            'killers': top_performers['killers'],
+            'damage_dealers': top_performers['damage_dealers'],
+            'healers': top_performers['healers'],
+            'souls': top_performers['souls'],
+            'last_hits': top_performers['last_hits'],
+            'obj_damage': top_performers['obj_damage'],
+            'kda': top_performers['kda'],
+            'assists': top_performers['assists']
+        },
+        'hero_records': hero_records
+    }
 
-def _get_cached_statistics():
-    """Get cached statistics, computing if necessary."""
-    global _stats_cache, _last_update
+def _disk_cache_path():
+    """Cached statistics (JSON) live next to the database so every worker shares them."""
+    db_path = Path(current_app.config.get("DB_PATH", "./data/dlns.sqlite3")).resolve()
+    return db_path.with_name(db_path.name + ".stats.json")
+
+def _load_disk_cache(max_age=CACHE_DURATION):
+    """Return (stats, computed_at) from disk if fresh and current, else (None, 0)."""
+    path = _disk_cache_path()
+    try:
+        computed_at = path.stat().st_mtime
+        if time.time() - computed_at >= max_age:
+            return None, 0
+        with open(path, 'r', encoding='utf-8') as f:
+            payload = json.load(f)
+        if payload.get('version') != STATS_CACHE_VERSION:
+            return None, 0
+        return payload['stats'], computed_at
+    except FileNotFoundError:
+        return None, 0
+    except Exception as e:
+        logging.warning(f"Ignoring unreadable statistics cache {path}: {e}")
+        return None, 0
+
+def _save_disk_cache(stats):
+    """Write the statistics cache file atomically (temp file + os.replace)."""
+    path = _disk_cache_path()
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': STATS_CACHE_VERSION, 'stats': stats}, f)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logging.warning(f"Could not write statistics cache {path}: {e}")
+        tmp_path.unlink(missing_ok=True)
+
+def _acquire_compute_lock(lock_path):
+    """Create the cross-worker compute lock file; True if this process now holds it."""
+    for _ in range(2):
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            try:
+                if time.time() - lock_path.stat().st_mtime < STATS_LOCK_TIMEOUT:
+                    return False
+            except FileNotFoundError:
+                continue
+            lock_path.unlink(missing_ok=True)
+            continue
+        except OSError as e:
+            # Can't coordinate (e.g. read-only data dir); just compute locally
+            logging.warning(f"Could not create statistics lock {lock_path}: {e}")
+            return True
+        # Record the owner so we never remove a lock another worker took over
+        with os.fdopen(fd, 'w') as f:
+            f.write(str(os.getpid()))
+        return True
+    return False
+
+def _release_compute_lock(lock_path):
+    """Remove the compute lock, but only if this process still owns it."""
+    try:
+        if lock_path.read_text() == str(os.getpid()):
+            lock_path.unlink()
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logging.warning(f"Could not release statistics lock {lock_path}: {e}")
+
+def _refresh_locked(max_age=CACHE_DURATION, wait_for_peer=False):
+    """
+    Adopt a copy younger than max_age or recompute; caller must hold _refresh_inflight.
+    While another worker is computing, the stale snapshot is returned right
+    away unless there is none yet or wait_for_peer is set.
+    """
+    global _cache_state
     
     current_time = time.time()
     
-    with _cache_lock:
-        # Check if cache is still valid
-        if _stats_cache is not None and (current_time - _last_update) < CACHE_DURATION:
-            return _stats_cache
-        
+    # Re-check: another thread may have refreshed while we waited
+    stats, last_update = _cache_state
+    if stats is not None and (current_time - last_update) < max_age:
+        return stats
+    
+    # A fresh copy on disk (previous process / another worker) beats recomputing.
+    # Only one worker computes at a time; the others use its cache file.
+    lock_path = _disk_cache_path().with_suffix(".lock")
+    while True:
+        disk_stats, computed_at = _load_disk_cache(max_age)
+        if disk_stats is not None:
+            _cache_state = (disk_stats, computed_at)
+            return disk_stats
+        if _acquire_compute_lock(lock_path):
+            break
+        if stats is not None and not wait_for_peer:
+            return stats
+        # Bounded: a lock older than STATS_LOCK_TIMEOUT is broken above
+        time.sleep(0.5)
+    
+    try:
         # Cache is stale or doesn't exist, recompute
-        try:
-            logging.info("Computing fresh statistics...")
-            start_time = time.time()
-            _stats_cache = _compute_statistics()
-            _last_update = current_time
-            compute_time = time.time() - start_time
-            logging.info(f"Statistics computed in {compute_time:.2f} seconds")
-            return _stats_cache
-        except Exception as e:
-            logging.error(f"Error computing statistics: {e}")
-            # Return old cache if available, otherwise empty stats
-            return _stats_cache if _stats_cache else {}
+        logging.info("Computing fresh statistics...")
+        start_time = time.time()
+        fresh = _compute_statistics()
+        _cache_state = (fresh, current_time)
+        compute_time = time.time() - start_time
+        logging.info(f"Statistics computed in {compute_time:.2f} seconds")
+        _save_disk_cache(fresh)
+    finally:
+        _release_compute_lock(lock_path)
+    return fresh
+
+def _get_cached_statistics():
+    """Get cached statistics, computing if necessary."""
+    # Fast path: no lock while the cache is fresh
+    stats, last_update = _cache_state
+    if stats is not None and (time.time() - last_update) < CACHE_DURATION:
+        return stats
+    
+    # Stale: only one caller recomputes. Others get the stale copy right away,
+    # and only wait when there is nothing at all to show yet.
+    if not _refresh_inflight.acquire(blocking=stats is None):
+        return stats
+    try:
+        return _refresh_locked()
+    except Exception as e:
+        logging.error(f"Error computing statistics: {e}")
+        # Return old cache if available, otherwise empty stats
+        return stats if stats else {}
+    finally:
+        _refresh_inflight.release()
 
 def _background_refresh():
-    """Background task to refresh statistics cache."""
-    global _stats_cache, _last_update
+    """Background task to refresh statistics cache 30 seconds before it expires."""
     while True:
+        # Sleep exactly until the current snapshot is due (or until woken early)
+        due_in = _cache_state[1] + CACHE_DURATION - 30 - time.time()
+        if due_in > 0 and _refresh_wakeup.wait(due_in):
+            _refresh_wakeup.clear()
         try:
-            time.sleep(CACHE_DURATION - 30)  # Refresh 30 seconds before expiry
-            with _cache_lock:
-                current_time = time.time()
-                if (current_time - _last_update) >= (CACHE_DURATION - 30):
-                    logging.info("Background refresh of statistics cache...")
-                    # recompute and write cache
-                    data = _compute_statistics()
-                    _stats_cache = data
-                    _last_update = time.time()
+            with _refresh_inflight:
+                # Wait out a peer worker's compute rather than loop on stale data
+                _refresh_locked(max_age=CACHE_DURATION - 30, wait_for_peer=True)
         except Exception as e:
             logging.error(f"Background refresh error: {e}")
-        time.sleep(60)  # Check every minute
+            # Don't spin on a persistent error (e.g. database unavailable)
+            _refresh_wakeup.wait(60)
+            _refresh_wakeup.clear()
 
 # Start background refresh thread IN APP CONTEXT (replaces eager start)
 def _run_refresh_worker_in_app(app):
     with app.app_context():
+        _check_query_plans(get_ro_uri())
         _background_refresh()
 
 @stats_bp.before_app_request
@@ -487,17 +527,35 @@ def _start_stats_thread():
 @stats_bp.get('/')
 def statistics():
     """Display comprehensive database statistics."""
+    # The page header shows the logged-in user, so only anonymous renders are shared
+    shared = not is_logged_in()
+    if shared:
+        html = cache.get('stats_html')
+        if html is not None:
+            return html
+    
     stats_data = _get_cached_statistics()
-    return render_template('statistics.html', stats=stats_data)
+    html = render_template('statistics.html', stats=stats_data)
+    
+    if shared:
+        # Expire the page with the snapshot it shows, so an already-aged
+        # snapshot isn't served for another full CACHE_DURATION
+        snapshot, computed_at = _cache_state
+        remaining = int(computed_at + CACHE_DURATION - time.time())
+        if snapshot is stats_data and remaining > 0:
+            cache.set('stats_html', html, timeout=remaining)
+    return html
 
 # Add a manual refresh endpoint for admins
 @stats_bp.get('/refresh')
 def refresh_statistics():
     """Manually refresh statistics cache."""
-    global _stats_cache, _last_update
+    global _cache_state
     
-    with _cache_lock:
-        _stats_cache = None  # Force refresh
-        _last_update = 0
+    with _refresh_inflight:
+        _cache_state = (None, 0)  # Force refresh
+        _disk_cache_path().unlink(missing_ok=True)
+    cache.delete('stats_html')
+    _refresh_wakeup.set()  # recompute now in the background
     
     return "Statistics cache refreshed!", 200
\ No newline at end of file
@@ -356,6 +356,18 @@ CREATE TABLE IF NOT EXISTS players (
 
 CREATE INDEX IF NOT EXISTS idx_players_match ON players(match_id);
 CREATE INDEX IF NOT EXISTS idx_players_account ON players(account_id);
+-- Stats page: hero pick counts and the top-N / hero-record leaderboards read
+-- the tail of these (scanned backwards) instead of sorting all of players
+CREATE INDEX IF NOT EXISTS idx_players_hero ON players(hero_id);
+CREATE INDEX IF NOT EXISTS idx_players_kills ON players(kills);
+CREATE INDEX IF NOT EXISTS idx_players_assists ON players(assists);
+CREATE INDEX IF NOT EXISTS idx_players_damage ON players(player_damage);
+CREATE INDEX IF NOT EXISTS idx_players_healing ON players(player_healing);
+CREATE INDEX IF NOT EXISTS idx_players_net_worth ON players(net_worth);
+CREATE INDEX IF NOT EXISTS idx_players_last_hits ON players(last_hits);
+CREATE INDEX IF NOT EXISTS idx_players_obj_damage ON players(obj_damage);
+-- Stats page: duration MIN/MAX and shortest/longest match lookups
+CREATE INDEX IF NOT EXISTS idx_matches_duration ON matches(duration_s);
 
 CREATE TABLE IF NOT EXISTS user_stats (
 	account_id INTEGER PRIMARY KEY,
@@ -22,13 +22,29 @@ import os
 import sys
 import json
 import re
+import atexit
+import hashlib
 import sqlite3
+import functools
+import queue
 import logging
+import logging.handlers
 import traceback
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
+from operator import itemgetter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from PySide6.QtWidgets import (
     QApplication,
     QWidget,
@@ -38,7 +54,9 @@ from PySide6.QtWidgets import (
     QPushButton,
     QListWidget,
     QListWidgetItem,
+    QAbstractItemView,
     QTextEdit,
+    QProgressBar,
     QTabWidget,
     QFileDialog,
     QMessageBox,
@@ -46,7 +64,7 @@ from PySide6.QtWidgets import (
     QSizePolicy,
 )
 from PySide6.QtGui import QPalette, QColor, QFont
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QObject, QRunnable, QThreadPool, Signal
 
 # ---------------------------------------------------------------------------
 # Constants & Paths
@@ -66,6 +84,24 @@ LOG_FILE = APP_DIR / "installer.log"
 DB_FILENAME = "mods.db"
 DB_PATH = APP_DIR / DB_FILENAME
 
+# Shared HTTP session: keep-alive connections to the server are reused across
+# the mods list, version check and every download.
+_HTTP = requests.Session()
+_HTTP.mount(
+    "https://",
+    HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=Retry(total=3, backoff_factor=0.3)),
+)
+_HTTP.headers.update({
+    "Accept-Encoding": "gzip, deflate",
+    "User-Agent": f"DeadlockModInstaller/{INSTALLER_VERSION}",
+})
+
+# JSON payloads are parsed in C when orjson is bundled; stdlib json otherwise
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Parallel downloads when several mods are installed at once
+DOWNLOAD_WORKERS = 4
+
 # Deadlock paths (relative to Deadlock root)
 GAMEINFO_REL = Path("game") / "citadel" / "gameinfo.gi"
 ADDONS_REL = Path("game") / "citadel" / "addons"
@@ -87,6 +123,10 @@ PATCHED_SEARCHPATHS = r"""
         }
 """.rstrip()
 
+# Encoded once for byte-level patching, in both line-ending flavours
+_PATCHED_BLOCK_LF = PATCHED_SEARCHPATHS.encode("utf-8")
+_PATCHED_BLOCK_CRLF = _PATCHED_BLOCK_LF.replace(b"\n", b"\r\n")
+
 
 # ---------------------------------------------------------------------------
 # Logging & Error Handling
@@ -101,10 +141,18 @@ def setup_logging() -> None:
         # If this fails, we still try to log to the same file
         pass
 
+    # Callers only enqueue records; a background listener thread does the
+    # actual file writes so logging never blocks the GUI or download threads.
+    file_handler = logging.FileHandler(LOG_FILE, encoding="utf-8")
+    file_handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
     logging.basicConfig(
         level=logging.INFO,
-        format="%(asctime)s [%(levelname)s] %(message)s",
-        handlers=[logging.FileHandler(LOG_FILE, encoding="utf-8")],
+        handlers=[logging.handlers.QueueHandler(log_queue)],
     )
     logging.info("=== Deadlock Mod Installer started ===")
 
@@ -129,64 +177,177 @@ def install_excepthook():
 # SQLite DB (installed mods)
 # ---------------------------------------------------------------------------
 
-def init_db() -> None:
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
-    cur.execute(
-        """
-        CREATE TABLE IF NOT EXISTS installed_mods (
+_DB: sqlite3.Connection | None = None
+_DB_LOCK = threading.RLock()
+
+
+# Both tables are keyed by a natural TEXT key, so WITHOUT ROWID stores each
+# row once in the primary-key B-tree instead of a rowid table + separate index.
+_TABLES = {
+    "installed_mods": """
+        CREATE TABLE IF NOT EXISTS {name} (
             id TEXT PRIMARY KEY,
             title TEXT NOT NULL,
             filename TEXT NOT NULL,
             installed_at TEXT NOT NULL
-        )
+        ) WITHOUT ROWID
+    """,
+    "settings": "CREATE TABLE IF NOT EXISTS {name} (k TEXT PRIMARY KEY, v TEXT) WITHOUT ROWID",
+}
+
+
+def _migrate_without_rowid(table: str) -> None:
+    """Rebuild a table created by older installer versions as WITHOUT ROWID."""
+    row = _DB.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)).fetchone()
+    if row is None or "WITHOUT ROWID" in row[0].upper():
+        return
+    with db_transaction() as db:
+        db.execute(_TABLES[table].format(name=f"{table}_new"))
+        db.execute(f"INSERT INTO {table}_new SELECT * FROM {table}")
+        db.execute(f"DROP TABLE {table}")
+        db.execute(f"ALTER TABLE {table}_new RENAME TO {table}")
+    logging.info("Migrated %s table to WITHOUT ROWID", table)
+
+
+def init_db() -> None:
+    """Open the single long-lived DB connection used by all db_* helpers."""
+    global _DB
+    _DB = sqlite3.connect(DB_PATH, isolation_level=None, check_same_thread=False, cached_statements=128)
+    _DB.executescript(
+        """
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA busy_timeout=5000;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA cache_size=-20000;
         """
     )
-    conn.commit()
-    conn.close()
+    for table, create_sql in _TABLES.items():
+        _migrate_without_rowid(table)
+        _DB.execute(create_sql.format(name=table))
+    atexit.register(_DB.close)
     logging.info("Database ready at %s", DB_PATH)
 
 
+@contextmanager
+def db_transaction():
+    """Run several statements on the shared connection as one explicit write transaction."""
+    with _DB_LOCK:
+        # IMMEDIATE takes the write lock up front, so a second process can't
+        # make us fail with SQLITE_BUSY halfway through a read->write upgrade.
+        _DB.execute("BEGIN IMMEDIATE")
+        try:
+            yield _DB
+        except BaseException:
+            _DB.execute("ROLLBACK")
+            raise
+        _DB.execute("COMMIT")
+
+
+def db_get_setting(key: str) -> str | None:
+    with _DB_LOCK:
+        row = _DB.execute("SELECT v FROM settings WHERE k = ?", (key,)).fetchone()
+    return row[0] if row else None
+
+
+def db_set_setting(key: str, value: str) -> None:
+    with _DB_LOCK:
+        _DB.execute("INSERT OR REPLACE INTO settings (k, v) VALUES (?, ?)", (key, value))
+
+
+# Kept as one constant string so the connection's statement cache reuses the
+# compiled statement instead of re-preparing it per install.
+_INSERT_SQL = "INSERT OR REPLACE INTO installed_mods (id, title, filename, installed_at) VALUES (?, ?, ?, ?)"
+
+
 def db_add_mod(mod_id: str, title: str, filename: str) -> None:
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
-    cur.execute(
-        "INSERT OR REPLACE INTO installed_mods (id, title, filename, installed_at) VALUES (?, ?, ?, ?)",
-        (mod_id, title, filename, datetime.utcnow().isoformat() + "Z"),
-    )
-    conn.commit()
-    conn.close()
-    logging.info("Recorded installed mod id=%s title=%s filename=%s", mod_id, title, filename)
+    """Record a single install; same write path as a batch."""
+    db_add_mods([(mod_id, title, filename)])
+
+
+# Rows per multi-row INSERT; 4 params each keeps us well under SQLite's
+# 999 bound-variable limit on older builds.
+DB_INSERT_CHUNK = 100
+
+
+def db_add_mods(rows: list[tuple[str, str, str]]) -> None:
+    """Record several (id, title, filename) installs: multi-row INSERTs, one transaction."""
+    # Same "...Z" format as before, without the deprecated utcnow()
+    now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    with db_transaction() as db:
+        for i in range(0, len(rows), DB_INSERT_CHUNK):
+            chunk = rows[i:i + DB_INSERT_CHUNK]
+            params = []
+            for mod_id, title, filename in chunk:
+                params.extend((mod_id, title, filename, now))
+            db.execute(_INSERT_SQL + ", (?, ?, ?, ?)" * (len(chunk) - 1), params)
+    logging.info("Recorded %d installed mods", len(rows))
 
 
 def db_remove_mod(mod_id: str) -> None:
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
-    cur.execute("DELETE FROM installed_mods WHERE id = ?", (mod_id,))
-    conn.commit()
-    conn.close()
+    with _DB_LOCK:
+        _DB.execute("DELETE FROM installed_mods WHERE id = ?", (mod_id,))
     logging.info("Removed mod id=%s from DB", mod_id)
 
 
 def db_list_mods():
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
-    cur.execute("SELECT id, title, filename, installed_at FROM installed_mods ORDER BY installed_at DESC")
-    rows = cur.fetchall()
-    conn.close()
-    return rows
+    """Return installed mod rows, fetched while holding the DB lock."""
+    with _DB_LOCK:
+        return _DB.execute("SELECT id, title, filename, installed_at FROM installed_mods ORDER BY installed_at DESC").fetchall()
 
 
 # ---------------------------------------------------------------------------
 # Deadlock path detection
 # ---------------------------------------------------------------------------
 
-def detect_deadlock_root() -> Path | None:
+def remember_deadlock_root(root: Path) -> None:
+    """Persist the Deadlock root so the next launch can skip the registry walk."""
+    try:
+        db_set_setting("deadlock_path", str(root))
+    except Exception as e:
+        logging.warning("Failed to store Deadlock root: %s", e)
+
+
+_VDF_PATH_RE = re.compile(r'"path"\s+"([^"]+)"')
+
+
+def steam_library_roots(steam_path: Path) -> list[Path]:
+    """
+    All Steam library folders: the main install first, then every extra
+    library listed in steamapps/libraryfolders.vdf (e.g. games on other drives).
+    """
+    roots = [steam_path]
+    vdf = steam_path / "steamapps" / "libraryfolders.vdf"
+    try:
+        text = vdf.read_text(encoding="utf-8", errors="ignore")
+    except OSError:
+        return roots
+    for raw in _VDF_PATH_RE.findall(text):
+        root = Path(raw.replace("\\\\", "\\"))
+        if root not in roots:
+            roots.append(root)
+    return roots
+
+
+def detect_deadlock_root(use_cache: bool = True) -> Path | None:
     """
     Try to auto-detect Deadlock root using Windows registry (Steam).
     Returns the Deadlock root folder, e.g.:
       C:\\Program Files (x86)\\Steam\\steamapps\\common\\Deadlock
+
+    A previously resolved path stored in the settings table is reused as long
+    as it still exists on disk; the registry is only consulted on a miss.
     """
+    if use_cache:
+        try:
+            cached = db_get_setting("deadlock_path")
+        except Exception as e:
+            logging.warning("Failed to read cached Deadlock root: %s", e)
+            cached = None
+        if cached and Path(cached).exists():
+            logging.info("Using cached Deadlock root %s", cached)
+            return Path(cached)
+
     logging.info("Attempting to auto-detect Deadlock root via registry...")
     try:
         import winreg
@@ -202,10 +363,12 @@ def detect_deadlock_root() -> Path | None:
         try:
             with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, key_path) as key:
                 install_path, _ = winreg.QueryValueEx(key, "InstallPath")
-                steam_path = Path(install_path)
-                candidate = steam_path / "steamapps" / "common" / "Deadlock"
+            steam_path = Path(install_path)
+            for library in steam_library_roots(steam_path):
+                candidate = library / "steamapps" / "common" / "Deadlock"
                 if candidate.exists():
                     logging.info("Detected Deadlock root at %s", candidate)
+                    remember_deadlock_root(candidate)
                     return candidate
         except FileNotFoundError:
             continue
@@ -220,6 +383,37 @@ def detect_deadlock_root() -> Path | None:
 # GameInfo patching
 # ---------------------------------------------------------------------------
 
+def _find_searchpaths_block(data: bytes) -> tuple[int, int] | None:
+    """
+    Locate the first `SearchPaths { ... }` block in raw gameinfo bytes.
+    Returns (start, end) offsets suitable for slicing, or None.
+    """
+    pos = data.find(b"SearchPaths")
+    while pos >= 0:
+        brace = pos + len(b"SearchPaths")
+        while brace < len(data) and data[brace:brace + 1].isspace():
+            brace += 1
+        if data[brace:brace + 1] == b"{":
+            # Walk brace to brace (not byte by byte) tracking depth, so a
+            # nested sub-block can't be mistaken for the end of SearchPaths.
+            depth = 1
+            i = brace + 1
+            while depth:
+                open_at = data.find(b"{", i)
+                close_at = data.find(b"}", i)
+                if close_at < 0:
+                    return None
+                if 0 <= open_at < close_at:
+                    depth += 1
+                    i = open_at + 1
+                else:
+                    depth -= 1
+                    i = close_at + 1
+            return pos, i
+        pos = data.find(b"SearchPaths", pos + 1)
+    return None
+
+
 def patch_gameinfo(deadlock_root: Path) -> str:
     """
     Patch the SearchPaths block in gameinfo.gi under:
@@ -233,23 +427,44 @@ def patch_gameinfo(deadlock_root: Path) -> str:
     if not gameinfo_path.exists():
         raise FileNotFoundError(f"gameinfo.gi not found at {gameinfo_path}")
 
-    text = gameinfo_path.read_text(encoding="utf-8", errors="ignore")
+    data = gameinfo_path.read_bytes()
+
+    # Fast path: file is byte-identical to what we last patched (or confirmed)
+    digest = hashlib.blake2b(data, digest_size=8).hexdigest()
+    if digest == db_get_setting("patched_hash"):
+        logging.info("gameinfo.gi matches last patched hash; no changes made.")
+        return "GameInfo is already patched."
+
+    # Work on raw bytes; match the file's own line endings so the splice and
+    # the "already patched" check behave like a text-mode round trip would.
+    block = _PATCHED_BLOCK_CRLF if b"\r\n" in data else _PATCHED_BLOCK_LF
 
     # If our desired block already exists, do nothing
-    if PATCHED_SEARCHPATHS.strip() in text:
+    if block.strip() in data:
+        db_set_setting("patched_hash", digest)
         logging.info("SearchPaths already patched; no changes made.")
         return "GameInfo is already patched."
 
     # Replace SearchPaths block inside FileSystem
-    pattern = r"SearchPaths\s*\{[\s\S]*?\}"
-    new_text, count = re.subn(pattern, PATCHED_SEARCHPATHS, text, count=1, flags=re.MULTILINE)
-
-    if count == 0:
+    span = _find_searchpaths_block(data)
+    if span is None:
         logging.error("Could not find SearchPaths block to patch.")
         raise RuntimeError("Could not find SearchPaths block in gameinfo.gi")
 
-    gameinfo_path.write_text(new_text, encoding="utf-8")
-    logging.info("SearchPaths patched successfully (replacements=%s).", count)
+    start, end = span
+    new_data = data[:start] + block + data[end:]
+    if new_data == data:
+        db_set_setting("patched_hash", digest)
+        logging.info("SearchPaths block unchanged by patch; skipping write.")
+        return "GameInfo is already patched."
+
+    # Write to a sibling temp file and swap it in atomically so a crash
+    # mid-write can never leave a truncated gameinfo.gi behind.
+    tmp_path = gameinfo_path.with_suffix(gameinfo_path.suffix + ".tmp")
+    tmp_path.write_bytes(new_data)
+    os.replace(tmp_path, gameinfo_path)
+    db_set_setting("patched_hash", hashlib.blake2b(new_data, digest_size=8).hexdigest())
+    logging.info("SearchPaths patched successfully.")
     return "GameInfo SearchPaths patched successfully."
 
 
@@ -263,89 +478,223 @@ def ensure_addons_dir(deadlock_root: Path) -> Path:
     return addons_dir
 
 
-def get_next_pak_filename(addons_dir: Path) -> str:
-    """
-    Determine next pakXX_dir.vpk filename.
-    Must start at pak01_dir.vpk (i.e. 01 is minimum).
-    """
-    existing_nums = []
-    for f in addons_dir.glob("pak*_dir.vpk"):
-        m = re.match(r"pak(\d+)_dir\.vpk$", f.name, re.IGNORECASE)
-        if m:
-            try:
-                existing_nums.append(int(m.group(1)))
-            except ValueError:
-                continue
+_PAK_LOCK = threading.Lock()
+# Slots handed to in-flight downloads. Kept in memory only: the real
+# pakNN_dir.vpk appears when its .part file is renamed into place, so a
+# crash mid-download never leaves an empty VPK for the game to mount.
+_RESERVED_PAKS: set[Path] = set()
 
-    if existing_nums:
-        next_num = max(existing_nums) + 1
-    else:
-        next_num = 1  # minimum pak01
 
-    if next_num < 1:
-        next_num = 1
+def scan_last_pak_index(addons_dir: Path) -> int:
+    """Highest NN among existing pakNN_dir.vpk files (0 if there are none)."""
+    mx = 0
+    with os.scandir(addons_dir) as it:
+        for entry in it:
+            name = entry.name.lower()
+            if name.startswith("pak") and name.endswith("_dir.vpk"):
+                mid = name[3:-8]
+                if mid.isascii() and mid.isdigit():
+                    v = int(mid)
+                    if v > mx:
+                        mx = v
+    return mx
 
-    filename = f"pak{next_num:02d}_dir.vpk"
-    logging.info("Next pak filename resolved as %s", filename)
-    return filename
 
+def reserve_pak_filenames(addons_dir: Path, count: int) -> list[str]:
+    """
+    Allocate `count` pak filenames (pak01_dir.vpk is the minimum) under a
+    lock, so concurrent installs can never be handed the same slot. Call release_pak_filenames once the
+    downloads have finished.
 
-def download_to_file(url: str, dest: Path) -> None:
+    The folder is rescanned every time (a single scandir pass) so paks added
+    outside the installer still push new mods after them.
+    """
+    with _PAK_LOCK:
+        last = scan_last_pak_index(addons_dir)
+        for path in _RESERVED_PAKS:
+            if path.parent == addons_dir:
+                last = max(last, int(path.name[3:-8]))
+        filenames = []
+        n = last + 1
+        while len(filenames) < count:
+            filename = f"pak{n:02d}_dir.vpk"
+            if not (addons_dir / filename).exists():
+                filenames.append(filename)
+            n += 1
+        _RESERVED_PAKS.update(addons_dir / filename for filename in filenames)
+    logging.info("Reserved pak filenames %s", ", ".join(filenames))
+    return filenames
+
+
+def release_pak_filenames(addons_dir: Path, filenames: list[str]) -> None:
+    with _PAK_LOCK:
+        _RESERVED_PAKS.difference_update(addons_dir / filename for filename in filenames)
+
+
+def download_to_file(url: str, dest: Path, sha256: str | None = None) -> None:
+    """
+    Download `url` to `dest` via a sibling .part file that is renamed into
+    place only once complete, so an interrupted download never leaves a
+    half-written VPK where the game would load it.
+    If `sha256` is given, the bytes are hashed as they stream in and a
+    mismatch is rejected before the file is renamed into place.
+    """
     logging.info("Downloading %s -> %s", url, dest)
-    with requests.get(url, stream=True, timeout=30) as r:
-        r.raise_for_status()
-        with open(dest, "wb") as f:
-            for chunk in r.iter_content(chunk_size=8192):
-                if chunk:
+    tmp = dest.with_name(dest.name + ".part")
+    digest = hashlib.sha256()
+    try:
+        with _HTTP.get(url, stream=True, timeout=30) as r:
+            r.raise_for_status()
+            r.raw.decode_content = True
+            with open(tmp, "wb") as f:
+                while chunk := r.raw.read(1024 * 1024):
                     f.write(chunk)
+                    digest.update(chunk)
+                f.flush()
+                os.fsync(f.fileno())
+        if sha256 and digest.hexdigest() != sha256.lower():
+            raise ValueError(f"Checksum mismatch for {url} (expected {sha256}, got {digest.hexdigest()})")
+        os.replace(tmp, dest)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
     logging.info("Download complete: %s", dest)
 
 
-def install_mod(deadlock_root: Path, mod: dict) -> str:
+_mod_id_title = itemgetter("id", "title")
+
+
+def install_mods(deadlock_root: Path, mods: list[dict], progress=None) -> list[str]:
     """
-    Install a mod from server into Deadlock's citadel/addons as the next pakXX_dir.vpk.
-    Returns the installed filename.
+    Install several mods into Deadlock's citadel/addons, each as the next pakXX_dir.vpk.
+    Downloads run in parallel; all successful installs are recorded in one DB commit.
+    `progress(done, total)` is called from the calling thread as each download finishes.
+    Returns the installed filenames (in the same order as `mods`).
     """
+    if not mods:
+        return []
+
+    for mod in mods:
+        if not mod.get("download_url"):
+            raise ValueError("Mod missing download_url")
+
     addons_dir = ensure_addons_dir(deadlock_root)
-    filename = get_next_pak_filename(addons_dir)
-    dest_path = addons_dir / filename
+    filenames = reserve_pak_filenames(addons_dir, len(mods))
 
-    download_url = mod.get("download_url")
-    if not download_url:
-        raise ValueError("Mod missing download_url")
+    try:
+        with ThreadPoolExecutor(max_workers=min(DOWNLOAD_WORKERS, len(mods))) as pool:
+            futures = [
+                pool.submit(download_to_file, mod["download_url"], addons_dir / filename, mod.get("sha256"))
+                for mod, filename in zip(mods, filenames)
+            ]
+            for done, _ in enumerate(as_completed(futures), 1):
+                if progress:
+                    progress(done, len(futures))
+    finally:
+        # Finished downloads are on disk now, so the next scan sees them
+        release_pak_filenames(addons_dir, filenames)
+
+    installed = []
+    errors = []
+    for mod, filename, fut in zip(mods, filenames, futures):
+        exc = fut.exception()
+        if exc is None:
+            installed.append((*_mod_id_title(mod), filename))
+            continue
+        logging.error("Download failed for mod %s: %s", mod.get("id"), exc)
+        errors.append(f"{mod.get('title', 'Untitled')}: {exc}")
 
-    download_to_file(download_url, dest_path)
-    db_add_mod(mod["id"], mod["title"], filename)
+    if installed:
+        db_add_mods(installed)
 
-    return filename
+    if errors:
+        raise RuntimeError("\n".join(errors))
+
+    return [filename for _, _, filename in installed]
+
+
+def install_mod(deadlock_root: Path, mod: dict) -> str:
+    """
+    Install a mod from server into Deadlock's citadel/addons as the next pakXX_dir.vpk.
+    Returns the installed filename.
+    """
+    return install_mods(deadlock_root, [mod])[0]
 
 
 def uninstall_mod(deadlock_root: Path, mod_id: str) -> bool:
-    rows = db_list_mods()
-    for (mid, title, filename, installed_at) in rows:
-        if mid == mod_id:
-            addons_dir = ensure_addons_dir(deadlock_root)
-            file_path = addons_dir / filename
-            if file_path.exists():
-                try:
-                    file_path.unlink()
-                    logging.info("Deleted file %s for mod %s", file_path, mid)
-                except Exception as e:
-                    logging.warning("Failed to delete %s: %s", file_path, e)
-            db_remove_mod(mid)
-            return True
-    return False
+    # Lookup and delete share one transaction so a concurrent install of the
+    # same id can't slip in between and lose its row.
+    with db_transaction() as db:
+        row = db.execute("SELECT filename FROM installed_mods WHERE id = ?", (mod_id,)).fetchone()
+        if row is None:
+            return False
+
+        file_path = deadlock_root / ADDONS_REL / row[0]
+        if file_path.exists():
+            try:
+                file_path.unlink()
+                logging.info("Deleted file %s for mod %s", file_path, mod_id)
+            except Exception as e:
+                logging.warning("Failed to delete %s: %s", file_path, e)
+        db.execute("DELETE FROM installed_mods WHERE id = ?", (mod_id,))
+    logging.info("Removed mod id=%s from DB", mod_id)
+    return True
 
 
 # ---------------------------------------------------------------------------
 # Network helpers
 # ---------------------------------------------------------------------------
 
+def cached_get_json(url: str, cache_name: str, timeout: int) -> dict:
+    """
+    GET a JSON endpoint, revalidating a copy cached in APP_DIR via
+    If-None-Match / If-Modified-Since. On 304 Not Modified the cached body
+    is reused instead of re-downloaded.
+    """
+    # One body + one validator file per endpoint (rather than a shared
+    # cache.json) so the mods and version workers never write the same file.
+    body_path = APP_DIR / f"{cache_name}_cache.json"
+    meta_path = APP_DIR / f"{cache_name}_cache.meta"
+
+    headers = {}
+    if body_path.exists() and meta_path.exists():
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except Exception:
+            meta = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    r = _HTTP.get(url, headers=headers, timeout=timeout)
+    if r.status_code == 304:
+        try:
+            data = _json_loads(body_path.read_bytes())
+            logging.info("%s not modified; using cached response", url)
+            return data
+        except Exception as e:
+            logging.warning("Cached response for %s unreadable (%s); refetching", url, e)
+            r = _HTTP.get(url, timeout=timeout)
+
+    r.raise_for_status()
+    data = _json_loads(r.content)
+
+    meta = {"etag": r.headers.get("ETag"), "last_modified": r.headers.get("Last-Modified")}
+    try:
+        if meta["etag"] or meta["last_modified"]:
+            body_path.write_bytes(r.content)
+            meta_path.write_text(json.dumps(meta), encoding="utf-8")
+        else:
+            meta_path.unlink(missing_ok=True)
+    except Exception as e:
+        logging.warning("Failed to cache response for %s: %s", url, e)
+    return data
+
+
 def fetch_mods_list() -> list[dict]:
     logging.info("Fetching mods list from %s", API_MODS)
-    r = requests.get(API_MODS, timeout=20)
-    r.raise_for_status()
-    data = r.json()
+    data = cached_get_json(API_MODS, "mods", timeout=20)
     mods = data.get("mods", [])
     if not isinstance(mods, list):
         raise ValueError("Unexpected mods payload")
@@ -356,9 +705,7 @@ def fetch_mods_list() -> list[dict]:
 def fetch_server_version() -> str | None:
     try:
         logging.info("Fetching server version from %s", API_VERSION)
-        r = requests.get(API_VERSION, timeout=10)
-        r.raise_for_status()
-        data = r.json()
+        data = cached_get_json(API_VERSION, "version", timeout=10)
         version = data.get("version")
         logging.info("Server installer version is %s", version)
         return version
@@ -392,6 +739,7 @@ def apply_dark_theme(app: QApplication) -> None:
     app.setFont(font)
 
 
+@functools.lru_cache(maxsize=2048)
 def human_time(iso_str: str | None) -> str:
     if not iso_str:
         return "Unknown"
@@ -403,6 +751,32 @@ def human_time(iso_str: str | None) -> str:
         return iso_str
 
 
+class _WorkerSignals(QObject):
+    finished = Signal(object)
+    failed = Signal(object)
+    progress = Signal(int, int)
+
+
+class _Worker(QRunnable):
+    """Run fn(*args, **kwargs) on the global thread pool; report back via signals."""
+
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = _WorkerSignals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            logging.error("Background task %s failed: %s", self.fn.__name__, e, exc_info=True)
+            self.signals.failed.emit(e)
+        else:
+            self.signals.finished.emit(result)
+
+
 # ---------------------------------------------------------------------------
 # Main Window / "Old" UI (tabbed, dark, modern)
 # ---------------------------------------------------------------------------
@@ -412,6 +786,8 @@ class InstallerWindow(QWidget):
         super().__init__()
         self.deadlock_root: Path | None = detect_deadlock_root()
         self.mods: list[dict] = []
+        self._workers: set[_Worker] = set()
+        self._installing_mods: list[dict] = []
 
         self.setWindowTitle("Deadlock Mod Installer")
         self.resize(900, 580)
@@ -457,6 +833,7 @@ class InstallerWindow(QWidget):
         mods_layout.addWidget(mods_header)
 
         self.mods_list = QListWidget()
+        self.mods_list.setSelectionMode(QAbstractItemView.ExtendedSelection)
         self.mods_list.setStyleSheet(
             "QListWidget { background-color: #181818; border: 1px solid #333333; }"
             "QListWidget::item { padding: 6px; }"
@@ -476,6 +853,11 @@ class InstallerWindow(QWidget):
 
         mods_layout.addLayout(btn_row)
 
+        self.install_progress = QProgressBar()
+        self.install_progress.setFormat("Downloading %v / %m")
+        self.install_progress.setVisible(False)
+        mods_layout.addWidget(self.install_progress)
+
         self.mod_details = QTextEdit()
         self.mod_details.setReadOnly(True)
         self.mod_details.setStyleSheet(
@@ -596,43 +978,68 @@ class InstallerWindow(QWidget):
         else:
             self.deadlock_label.setText("Not set")
 
+    def start_worker(self, worker: _Worker, on_done, on_error) -> None:
+        """Queue a worker; its slots run back on the GUI thread."""
+        # keep the worker (and its signals object) alive until a slot has run
+        self._workers.add(worker)
+        worker.signals.finished.connect(lambda _: self._workers.discard(worker))
+        worker.signals.failed.connect(lambda _: self._workers.discard(worker))
+        worker.signals.finished.connect(on_done)
+        worker.signals.failed.connect(on_error)
+        QThreadPool.globalInstance().start(worker)
+
     def refresh_mods_list(self):
-        try:
-            mods = fetch_mods_list()
-        except Exception as e:
-            logging.error("Failed to fetch mods: %s", e)
-            QMessageBox.warning(self, "Error", f"Failed to fetch mods:\n{e}")
-            return
+        self.btn_refresh_mods.setEnabled(False)
+        self.start_worker(_Worker(fetch_mods_list), self.on_mods_fetched, self.on_mods_fetch_failed)
 
-        self.mods = mods
-        self.mods_list.clear()
+    def on_mods_fetch_failed(self, e: Exception):
+        self.btn_refresh_mods.setEnabled(True)
+        QMessageBox.warning(self, "Error", f"Failed to fetch mods:\n{e}")
 
-        for m in mods:
-            title = m.get("title", "Untitled")
-            uploaded_at = human_time(m.get("uploaded_at"))
-            item_text = f"{title}  •  Uploaded: {uploaded_at}"
-            item = QListWidgetItem(item_text)
-            self.mods_list.addItem(item)
+    def on_mods_fetched(self, mods: list[dict]):
+        self.btn_refresh_mods.setEnabled(True)
+        self.mods = mods
 
-        if mods:
-            self.mods_list.setCurrentRow(0)
+        self.mods_list.setUpdatesEnabled(False)
+        self.mods_list.blockSignals(True)
+        try:
+            self.mods_list.clear()
+            for m in mods:
+                item = QListWidgetItem(
+                    f"{m.get('title', 'Untitled')}  •  Uploaded: {human_time(m.get('uploaded_at'))}"
+                )
+                # store the full mod dict in data
+                item.setData(Qt.UserRole, m)
+                self.mods_list.addItem(item)
+            if mods:
+                self.mods_list.setCurrentRow(0)
+        finally:
+            self.mods_list.blockSignals(False)
+            self.mods_list.setUpdatesEnabled(True)
         self.update_mod_details()
 
     def refresh_installed_list(self):
-        self.installed_list.clear()
-        rows = db_list_mods()
-        for mid, title, filename, installed_at in rows:
-            text = f"{title}  •  {filename}  •  Installed: {human_time(installed_at)}"
-            item = QListWidgetItem(text)
-            # store id in data
-            item.setData(Qt.UserRole, mid)
-            self.installed_list.addItem(item)
+        self.installed_list.setUpdatesEnabled(False)
+        self.installed_list.blockSignals(True)
+        try:
+            self.installed_list.clear()
+            for mid, title, filename, installed_at in db_list_mods():
+                text = f"{title}  •  {filename}  •  Installed: {human_time(installed_at)}"
+                item = QListWidgetItem(text)
+                # store id in data
+                item.setData(Qt.UserRole, mid)
+                self.installed_list.addItem(item)
+        finally:
+            self.installed_list.blockSignals(False)
+            self.installed_list.setUpdatesEnabled(True)
 
     def current_selected_mod(self) -> dict | None:
-        row = self.mods_list.currentRow()
-        if row < 0 or row >= len(self.mods):
-            return None
-        return self.mods[row]
+        item = self.mods_list.currentItem()
+        return item.data(Qt.UserRole) if item else None
+
+    def selected_mods(self) -> list[dict]:
+        items = sorted(self.mods_list.selectedItems(), key=self.mods_list.row)
+        return [item.data(Qt.UserRole) for item in items]
 
     def update_mod_details(self):
         mod = self.current_selected_mod()
@@ -675,25 +1082,47 @@ class InstallerWindow(QWidget):
         if not self.ensure_deadlock_root():
             return
 
-        mod = self.current_selected_mod()
-        if not mod:
+        mods = self.selected_mods()
+        if not mods:
             QMessageBox.information(self, "No mod selected", "Please select a mod to install.")
             return
 
-        try:
-            filename = install_mod(self.deadlock_root, mod)
-        except Exception as e:
-            logging.error("Error installing mod: %s", e, exc_info=True)
-            QMessageBox.critical(self, "Install failed", f"Installing mod failed:\n{e}")
-            return
+        self.btn_install_selected.setEnabled(False)
+        self._installing_mods = mods
+        self.install_progress.setRange(0, len(mods))
+        self.install_progress.setValue(0)
+        self.install_progress.setVisible(True)
+
+        worker = _Worker(install_mods, self.deadlock_root, mods)
+        worker.kwargs["progress"] = worker.signals.progress.emit
+        worker.signals.progress.connect(self.update_install_progress)
+        self.start_worker(worker, self.on_mods_installed, self.on_install_failed)
+
+    def on_install_failed(self, e: Exception):
+        self.btn_install_selected.setEnabled(True)
+        self.install_progress.setVisible(False)
+        QMessageBox.critical(self, "Install failed", f"Installing mod failed:\n{e}")
+        self.refresh_installed_list()
 
-        QMessageBox.information(
-            self,
-            "Mod installed",
-            f"Mod \"{mod.get('title', 'Untitled')}\" installed as {filename}.",
-        )
+    def on_mods_installed(self, filenames: list[str]):
+        self.btn_install_selected.setEnabled(True)
+        self.install_progress.setVisible(False)
+        mods = self._installing_mods
+
+        if len(mods) == 1:
+            msg = f"Mod \"{mods[0].get('title', 'Untitled')}\" installed as {filenames[0]}."
+        else:
+            msg = "\n".join(
+                f"\"{mod.get('title', 'Untitled')}\" installed as {filename}."
+                for mod, filename in zip(mods, filenames)
+            )
+        QMessageBox.information(self, "Mod installed", msg)
         self.refresh_installed_list()
 
+    def update_install_progress(self, done: int, total: int):
+        self.install_progress.setRange(0, total)
+        self.install_progress.setValue(done)
+
     def uninstall_selected_mod(self):
         if not self.ensure_deadlock_root():
             return
@@ -733,19 +1162,25 @@ class InstallerWindow(QWidget):
         if not self.ensure_deadlock_root():
             return
 
-        try:
-            result = patch_gameinfo(self.deadlock_root)
-        except Exception as e:
-            logging.error("Error patching gameinfo: %s", e, exc_info=True)
-            self.patch_output.setPlainText(f"Error: {e}")
-            QMessageBox.critical(self, "Patch failed", f"Patching gameinfo.gi failed:\n{e}")
-            return
+        self.btn_patch_gameinfo.setEnabled(False)
+        self.start_worker(
+            _Worker(patch_gameinfo, self.deadlock_root),
+            self.on_gameinfo_patched,
+            self.on_gameinfo_patch_failed,
+        )
 
+    def on_gameinfo_patch_failed(self, e: Exception):
+        self.btn_patch_gameinfo.setEnabled(True)
+        self.patch_output.setPlainText(f"Error: {e}")
+        QMessageBox.critical(self, "Patch failed", f"Patching gameinfo.gi failed:\n{e}")
+
+    def on_gameinfo_patched(self, result: str):
+        self.btn_patch_gameinfo.setEnabled(True)
         self.patch_output.setPlainText(result)
         QMessageBox.information(self, "GameInfo patched", result)
 
     def auto_detect_deadlock(self):
-        root = detect_deadlock_root()
+        root = detect_deadlock_root(use_cache=False)
         if not root:
             QMessageBox.warning(
                 self,
@@ -775,12 +1210,18 @@ class InstallerWindow(QWidget):
             )
             return
         self.deadlock_root = root
+        remember_deadlock_root(root)
         self.update_deadlock_label()
         self.update_status_bar()
 
     def check_server_version(self):
-        server_version = fetch_server_version()
-        if not server_version:
+        self.btn_check_version.setEnabled(False)
+        # fetch_server_version already logs and returns None on failure
+        self.start_worker(_Worker(fetch_server_version), self.on_server_version, self.on_server_version)
+
+    def on_server_version(self, server_version):
+        self.btn_check_version.setEnabled(True)
+        if not isinstance(server_version, str) or not server_version:
             QMessageBox.warning(self, "Version check", "Could not contact server for version info.")
             return
 
@@ -6,7 +6,10 @@ Automatically downloads and installs the OneLane mod from DLNS Stats.
 Usage: python onelane_installer.py
 """
 
+import io
 import os
+import re
+import functools
 import sys
 import winreg
 import zipfile
@@ -16,6 +19,7 @@ import urllib.error
 from pathlib import Path
 import shutil
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 # Configuration
 DOWNLOAD_URL = "https://dlns-stats.co.uk/onelane/download/zip"
@@ -32,65 +36,69 @@ def safe_input(prompt="Press Enter to exit..."):
         time.sleep(3)
         return ""
 
+# Registry locations Steam records its install path under, in lookup order
+_STEAM_KEYS = [
+    (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\Valve\Steam"),  # system-wide install
+    (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Valve\Steam"),              # 64-bit without WOW6432Node
+    (winreg.HKEY_CURRENT_USER, r"SOFTWARE\Valve\Steam"),               # user install
+]
+
+@functools.lru_cache(maxsize=1)
 def find_steam_path():
     """Find Steam installation path from Windows registry."""
-    try:
-        # Try HKEY_LOCAL_MACHINE first (system-wide install)
-        try:
-            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\Valve\Steam") as key:
-                steam_path, _ = winreg.QueryValueEx(key, "InstallPath")
-                return Path(steam_path)
-        except FileNotFoundError:
-            pass
-        
-        # Try HKEY_LOCAL_MACHINE without WOW6432Node (64-bit)
+    for hive, sub_key in _STEAM_KEYS:
         try:
-            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Valve\Steam") as key:
+            with winreg.OpenKey(hive, sub_key) as key:
                 steam_path, _ = winreg.QueryValueEx(key, "InstallPath")
                 return Path(steam_path)
         except FileNotFoundError:
-            pass
-        
-        # Try HKEY_CURRENT_USER (user install)
-        try:
-            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"SOFTWARE\Valve\Steam") as key:
-                steam_path, _ = winreg.QueryValueEx(key, "InstallPath")
-                return Path(steam_path)
-        except FileNotFoundError:
-            pass
-        
-    except Exception as e:
-        print(f"Error accessing registry: {e}")
+            continue
+        except Exception as e:
+            print(f"Error accessing registry: {e}")
     
     return None
 
+_VDF_PATH_RE = re.compile(r'"path"\s+"([^"]+)"')
+
+def find_steam_libraries(steam_path):
+    """Steam install folder plus any extra libraries listed in libraryfolders.vdf."""
+    libraries = [steam_path]
+    try:
+        text = (steam_path / "steamapps" / "libraryfolders.vdf").read_text(encoding="utf-8", errors="ignore")
+    except OSError:
+        return libraries
+    
+    for raw in _VDF_PATH_RE.findall(text):
+        library = Path(raw.replace("\\\\", "\\"))
+        if library not in libraries:
+            libraries.append(library)
+    return libraries
+
 def find_deadlock_path(steam_path):
-    """Find Deadlock installation path."""
+    """Find Deadlock installation path in any Steam library."""
     if not steam_path:
         return None
     
-    deadlock_path = steam_path / "steamapps" / "common" / "Deadlock"
-    if deadlock_path.exists():
-        return deadlock_path
+    for library in find_steam_libraries(steam_path):
+        deadlock_path = library / "steamapps" / "common" / "Deadlock"
+        if deadlock_path.exists():
+            return deadlock_path
     
     return None
 
-def download_mod(url, temp_dir):
-    """Download the mod zip file."""
+def download_mod(url):
+    """Download the mod zip into memory (no temp file to write and read back)."""
     print(f"Downloading {MOD_NAME} mod from {url}...")
     
-    zip_path = temp_dir / "ARAM-OneLane.zip"
-    
     try:
         with urllib.request.urlopen(url) as response:
             if response.status != 200:
                 raise urllib.error.HTTPError(url, response.status, "Download failed", None, None)
             
-            with open(zip_path, 'wb') as f:
-                shutil.copyfileobj(response, f)
+            zip_data = io.BytesIO(response.read())
         
         print("✓ Download completed successfully!")
-        return zip_path
+        return zip_data
     
     except urllib.error.URLError as e:
         print(f"✗ Failed to download mod: {e}")
@@ -99,13 +107,28 @@ def download_mod(url, temp_dir):
         print(f"✗ Unexpected error during download: {e}")
         return None
 
-def extract_mod(zip_path, temp_dir):
-    """Extract the mod zip file."""
+def extract_mod(zip_file, temp_dir):
+    """Extract the mod zip (a path or file-like object) into temp_dir."""
     print("Extracting mod files...")
     
     try:
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            zip_ref.extractall(temp_dir)
+        root = temp_dir.resolve()
+        with zipfile.ZipFile(zip_file, 'r') as zip_ref:
+            for info in zip_ref.infolist():
+                dest = (temp_dir / info.filename).resolve()
+                # Refuse entries that would land outside temp_dir ("../" or absolute names)
+                if root != dest and root not in dest.parents:
+                    raise ValueError(f"Unsafe path in zip: {info.filename}")
+                if info.is_dir():
+                    dest.mkdir(parents=True, exist_ok=True)
+                    continue
+                # Already extracted (e.g. a retried run) - leave it alone
+                if dest.exists():
+                    continue
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                # 1MB chunks instead of extractall's small default buffer
+                with zip_ref.open(info) as src, open(dest, 'wb') as dst:
+                    shutil.copyfileobj(src, dst, 1024 * 1024)
         
         print("✓ Extraction completed successfully!")
         return True
@@ -137,26 +160,32 @@ def install_files(temp_dir, deadlock_path):
         return False, conflicts, installed
     
     try:
-        # Walk through all files in the game directory
-        for root, dirs, files in os.walk(game_source):
+        # Walk once to create directories and collect (source, dest, rel) jobs.
+        # Plain os.path strings here: no Path object per file in the hot loop.
+        source_str = str(game_source)
+        dest_str = str(deadlock_game_path)
+        jobs = []
+        for root, dirs, files in os.walk(source_str):
+            rel_root = os.path.relpath(root, source_str)
+            dest_root = os.path.normpath(os.path.join(dest_str, rel_root))
+            os.makedirs(dest_root, exist_ok=True)
             for file in files:
-                source_file = Path(root) / file
-                # Get relative path from game folder
-                rel_path = source_file.relative_to(game_source)
-                dest_file = deadlock_game_path / rel_path
-                
-                # Create destination directory if it doesn't exist
-                dest_file.parent.mkdir(parents=True, exist_ok=True)
-                
-                # Check if file already exists
-                if dest_file.exists():
-                    conflicts.append(str(rel_path))
-                    print(f"⚠ File already exists: {rel_path}")
-                else:
-                    # Copy the file
-                    shutil.copy2(source_file, dest_file)
-                    installed.append(str(rel_path))
-                    print(f"✓ Installed: {rel_path}")
+                rel_path = os.path.normpath(os.path.join(rel_root, file))
+                jobs.append((os.path.join(root, file), os.path.join(dest_root, file), rel_path))
+        
+        def _copy_one(job):
+            source_file, dest_file, rel_path = job
+            # Never overwrite an existing file, just report it
+            if os.path.exists(dest_file):
+                return "conflict", rel_path
+            shutil.copy2(source_file, dest_file)
+            return "installed", rel_path
+        
+        # Copies are disk-bound, so overlapping them helps even with the GIL;
+        # per-file output is left out since printing dominated on big trees
+        with ThreadPoolExecutor(max_workers=min(8, (os.cpu_count() or 1) * 2)) as pool:
+            for status, rel_path in pool.map(_copy_one, jobs):
+                (installed if status == "installed" else conflicts).append(rel_path)
         
         # Also copy README if it exists (place in main Deadlock folder for visibility)
         readme_source = temp_dir / "README.txt"
@@ -248,13 +277,13 @@ def main():
         temp_path = Path(temp_dir)
         
         # Download mod
-        zip_path = download_mod(DOWNLOAD_URL, temp_path)
-        if not zip_path:
+        zip_data = download_mod(DOWNLOAD_URL)
+        if not zip_data:
             safe_input("\nPress Enter to exit...")
             sys.exit(1)
         
         # Extract mod
-        if not extract_mod(zip_path, temp_path):
+        if not extract_mod(zip_data, temp_path):
             safe_input("\nPress Enter to exit...")
             sys.exit(1)
         
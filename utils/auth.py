@@ -1,7 +1,10 @@
 from functools import wraps
 from flask import session, flash, redirect, url_for
+from dotenv import load_dotenv
 import os
 
+load_dotenv()
+
 def is_logged_in():
     """Check if user is logged in"""
     return 'discord_user' in session
@@ -20,16 +23,24 @@ def require_login(f):
         return f(*args, **kwargs)
     return decorated_function
 
+def _read_privileged_ids():
+    """Parse owner/admin Discord IDs from the environment"""
+    owner_id = os.getenv('DISCORD_OWNER_ID', '').strip()
+    admin_ids = tuple(admin_id.strip() for admin_id in os.getenv('DISCORD_ADMIN_IDS', '').split(',') if admin_id.strip())
+    # Owner is always admin
+    privileged = frozenset(admin_ids) | ({owner_id} if owner_id else frozenset())
+    return owner_id, admin_ids, privileged
+
+# Read once at import instead of on every auth check (restart to pick up changes)
+_OWNER_ID, _ADMIN_ID_LIST, _ADMIN_IDS = _read_privileged_ids()
+
 def get_owner_id():
     """Get the owner Discord ID from environment"""
-    return os.getenv('DISCORD_OWNER_ID', '')
+    return _OWNER_ID
 
 def get_admin_ids():
     """Get admin Discord IDs from environment"""
-    admin_ids = os.getenv('DISCORD_ADMIN_IDS', '')
-    if admin_ids:
-        return [admin_id.strip() for admin_id in admin_ids.split(',') if admin_id.strip()]
-    return []
+    return list(_ADMIN_ID_LIST)
 
 def is_owner(user_id=None):
     """Check if user is the owner"""
@@ -39,8 +50,7 @@ def is_owner(user_id=None):
             return False
         user_id = user['id']
     
-    owner_id = get_owner_id()
-    return str(user_id) == str(owner_id)
+    return str(user_id) == _OWNER_ID
 
 def is_admin(user_id=None):
     """Check if user is admin (includes owner)"""
@@ -50,12 +60,8 @@ def is_admin(user_id=None):
             return False
         user_id = user['id']
     
-    # Owner is always admin
-    if is_owner(user_id):
-        return True
-    
-    admin_ids = get_admin_ids()
-    return str(user_id) in [str(admin_id) for admin_id in admin_ids]
+    # Owner is already in the set, so no separate is_owner check
+    return str(user_id) in _ADMIN_IDS
 
 def require_owner(f):
     """Decorator to require owner privileges"""